@@ -1,8 +1,10 @@
-from instalar.client.console import main
+import sys
 
 # For others
 def main_cli():
-    exit(main())
+    # Imported here so resolving the entry point doesn't load the console stack
+    from instalar.client.console import main
+    sys.exit(main())
 
 # For windows. On Windows, scripts packaged this way need a terminal,
 # so if you launch them from within a graphical application, they will make a terminal pop up.
@@ -1,5 +1,9 @@
 # Import standard library for command line argument parsing
 import argparse
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Generator
 # Import prompt_toolkit for enhanced command line interface
 from prompt_toolkit import PromptSession
@@ -20,7 +24,37 @@ from instalar.server.message_broker import MessageBroker
 from instalar.client.console_autocomplete import AutoCompleter
 from instalar.client.console_formatter import ConsoleFormatter
 from instalar.client.console_processor import CommandProcessor
-from instalar.client.console_response import ResponseHandler
+from instalar.client.console_response import StreamingSectionParser
+
+
+_TERMINATE_MARKER = "<TERMINATE></TERMINATE>"
+
+# Shown when the LLM signals that the operation is complete
+_DONE_HEADER = Text("\n🎉 Operation Complete!\n", style="bold green")
+_DONE_BODY = Text("All steps have been successfully completed. Returning to menu...")
+
+# Streamed output is re-rendered at most every _RENDER_INTERVAL seconds,
+# or sooner once _RENDER_PENDING_CHARS new characters have arrived
+_RENDER_INTERVAL = 0.25
+_RENDER_PENDING_CHARS = 512
+
+class _DeferredOutput(logging.Handler):
+    """Holds back background detection output so it can be shown later
+
+    Used both as the console passed to the detector (print) and as a handler
+    on its logger (emit); the calls are kept in order so they can be replayed
+    as they happened.
+    """
+    def __init__(self):
+        super().__init__()
+        # ("print", (args, kwargs)) or ("log", record) entries
+        self.items = []
+
+    def print(self, *args, **kwargs):
+        self.items.append(("print", (args, kwargs)))
+
+    def emit(self, record):
+        self.items.append(("log", record))
 
 
 class SimpleTerminal:
@@ -37,12 +71,21 @@ class SimpleTerminal:
         self.verification_class = VerificationOutput
         self.obs_menu = ObsMenu
 
-        # Initialize and run system detection
+        # Initialize and run system detection. On a terminal it runs in the
+        # background while the menus are shown, and is only waited for when
+        # system_info is first needed
         detector = SystemTelemetryDetection()
-        self.system_info = detector.collect_system_info(self.console)
+        self._system_info = None
+        self._sysinfo_future = None
+        if sys.stdout.isatty():
+            self._start_background_detection(detector)
+        else:
+            self._system_info = detector.collect_system_info(self.console)
+        # Bumped whenever system_info is modified so its JSON dump can be cached
+        self.system_info_version = 0
 
-        # Create message broker instance with system info
-        self.message_broker = MessageBroker(system_info=self.system_info)
+        # Message broker is created with system info on first use
+        self._message_broker = None
         
         # Set up prompt session with markdown highlighting and command completion
         self.session = PromptSession(
@@ -58,6 +101,54 @@ class SimpleTerminal:
         # Initialize command processor
         self.cmd_processor = CommandProcessor(self)
 
+    def _start_background_detection(self, detector: SystemTelemetryDetection) -> None:
+        """Run system detection on a worker thread, holding back its output
+
+        Its console messages and log records would otherwise land in the
+        middle of the menus; they are shown when system_info is first read.
+        """
+        self._deferred_output = _DeferredOutput()
+        self._detector_logger = detector.logger
+        self._detector_handlers = list(detector.logger.handlers)
+        for handler in self._detector_handlers:
+            detector.logger.removeHandler(handler)
+        detector.logger.addHandler(self._deferred_output)
+        
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._sysinfo_future = executor.submit(detector.collect_system_info, self._deferred_output)
+        executor.shutdown(wait=False)
+
+    def _show_deferred_detection_output(self) -> None:
+        """Restore the detector's log handlers and show what detection held back"""
+        self._detector_logger.removeHandler(self._deferred_output)
+        for handler in self._detector_handlers:
+            self._detector_logger.addHandler(handler)
+        
+        for kind, item in self._deferred_output.items:
+            if kind == "print":
+                args, kwargs = item
+                self.console.print(*args, **kwargs)
+            else:
+                for handler in self._detector_handlers:
+                    if item.levelno >= handler.level:
+                        handler.handle(item)
+        self._deferred_output.items.clear()
+
+    @property
+    def system_info(self) -> dict:
+        """Detected system information, waiting for background detection if needed"""
+        if self._system_info is None:
+            self._system_info = self._sysinfo_future.result()
+            self._show_deferred_detection_output()
+        return self._system_info
+
+    @property
+    def message_broker(self) -> MessageBroker:
+        """Message broker for LLM interaction, created with system info on first use"""
+        if self._message_broker is None:
+            self._message_broker = MessageBroker(system_info=self.system_info)
+        return self._message_broker
+
     def get_input(self, prompt="> ") -> Optional[str]:
         """Get input from user with completion and history"""
         try:
@@ -106,6 +197,7 @@ class SimpleTerminal:
             self.system_info['last_llm_response'] = {}
         
         self.system_info['last_llm_response'] = sections
+        self.system_info_version += 1
         
         # Update execution and verification commands if present
         if sections['execution']:
@@ -113,6 +205,12 @@ class SimpleTerminal:
         if sections['verification']:
             self.last_verify_command = sections['verification']
 
+    @staticmethod
+    def _as_str(generator):
+        """Yield chunks from the generator, converting any non-str chunk to str"""
+        for content in generator:
+            yield content if type(content) is str else str(content)
+
     def show_streaming_output(self, generator: Generator[str, None, None]):
         """Show streaming output with live updates and XML section parsing"""
         try:
@@ -120,30 +218,76 @@ class SimpleTerminal:
                 self.show_error("No content received from generator")
                 return
                 
-            accumulated_text = ""
-            with Live(refresh_per_second=4) as live:
-                for content in generator:
-                    if not isinstance(content, str):
-                        content = str(content)
-                    
-                    accumulated_text += content
-                    
+            # Parses sections incrementally as chunks arrive
+            parser = StreamingSectionParser()
+            # Enough of the previous text to catch a marker split across chunks
+            terminate_keep = len(_TERMINATE_MARKER) - 1
+            # Renders are already coalesced below, so refresh on update rather
+            # than starting a refresh thread for every response
+            with Live(auto_refresh=False) as live:
+                # Only rebuild the display every _RENDER_INTERVAL seconds;
+                # the first chunk is always rendered straight away
+                last_render = float("-inf")
+                pending_chars = 0
+                tail = ""
+                # Sections only change when a closing tag arrives, so parsing
+                # waits until "</" has been seen since the last render
+                has_pending_close = False
+                
+                # Bind the per-chunk callables to locals ahead of the loop
+                feed = parser.feed
+                parse = parser.parse
+                sections = parser.sections
+                update_sys = self._update_system_info
+                fmt = ConsoleFormatter.format_response_text
+                upd = live.update
+                monotonic = time.monotonic
+                term = _TERMINATE_MARKER
+                
+                # Sections as of the last render, to skip renders that change nothing
+                prev_sections = None
+                
+                def render():
+                    nonlocal prev_sections
+                    parse()
+                    current = tuple(sections.values())
+                    if current == prev_sections:
+                        return
+                    prev_sections = current
                     try:
-                        # Check for termination signal
-                        if "<TERMINATE></TERMINATE>" in accumulated_text:
-                            self.console.print(Markdown("\n## 🎉 Operation Complete!"))
-                            self.console.print(Markdown("All steps have been successfully completed. Returning to menu..."))
-                            return
-                        
-                        # Extract and process sections
-                        sections = ResponseHandler.extract_response_sections(accumulated_text)
-                        self._update_system_info(sections)
-                        formatted_text = ConsoleFormatter.format_response_text(sections)
-                        live.update(formatted_text)
-                        
+                        update_sys(sections)
+                        upd(fmt(sections), refresh=True)
                     except Exception as format_error:
                         print(f"***DEBUG Formatting error: {str(format_error)}")
-                        live.update(Text(accumulated_text))
+                        upd(Text(parser.text), refresh=True)
+                
+                for content in self._as_str(generator):
+                    feed(content)
+                    pending_chars += len(content)
+                    if "</" in content or (content[:1] == "/" and tail[-1:] == "<"):
+                        has_pending_close = True
+                    
+                    # Check for termination signal in the new text plus the tail
+                    # of the previous text
+                    probe = tail + content
+                    if probe.find(term) >= 0:
+                        self.console.print(_DONE_HEADER)
+                        self.console.print(_DONE_BODY)
+                        return
+                    tail = probe[-terminate_keep:]
+                    
+                    now = monotonic()
+                    if has_pending_close and (now - last_render >= _RENDER_INTERVAL or pending_chars >= _RENDER_PENDING_CHARS):
+                        render()
+                        last_render = now
+                        pending_chars = 0
+                        # Keep waiting if a closing tag is still cut off after its "</"
+                        text = parser.text
+                        has_pending_close = text.rfind("</") > text.rfind(">")
+                
+                # Flush whatever arrived since the last render; a no-op if
+                # no section changed
+                render()
             
             # Get command execution confirmation if we have commands
             if self.last_exec_command or self.last_verify_command:
@@ -152,6 +296,11 @@ class SimpleTerminal:
         except Exception as e:
             self.show_error(f"Output error: {str(e)}")
             print(f"***DEBUG show_streaming_output error: {str(e)}")
+        finally:
+            # Stop the response stream if we returned early (e.g. on TERMINATE)
+            close = getattr(generator, "close", None)
+            if close is not None:
+                close()
 
 
 def main():
@@ -187,6 +336,7 @@ def main():
                 # Add infrastructure selection to system info under user_select_info
                 io.system_info['user_select_info']['mode_type'] = mode_type
                 io.system_info['user_select_info']['selected_platform'] = selection
+                io.system_info_version += 1
 
             # Handle command loop
             should_continue = io.handle_command_loop(mode_type, selection, obs_operation)
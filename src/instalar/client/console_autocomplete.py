@@ -1,16 +1,22 @@
+from bisect import bisect_left
+
 from prompt_toolkit.completion import Completer, Completion
 
 class AutoCompleter(Completer):
     """Simple completer that completes from a list of words"""
     def __init__(self, words):
-        # Store list of available commands for completion
-        self.words = words
+        # Store available commands sorted so matches for a prefix are contiguous
+        self.words = sorted(words)
 
     def get_completions(self, document, complete_event):
         # Get the partial word the user is typing
         word = document.get_word_before_cursor()
-        # Check each command if it matches the partial word
-        for cmd in self.words:
-            if cmd.startswith(word):
-                # Yield matching commands as completion options
-                yield Completion(cmd, start_position=-len(word))
+        words = self.words
+        start_position = -len(word)
+        # Binary search to the first command that could match the partial word,
+        # then yield matching commands until the prefix no longer matches
+        for i in range(bisect_left(words, word), len(words)):
+            cmd = words[i]
+            if not cmd.startswith(word):
+                break
+            yield Completion(cmd, start_position=start_position)
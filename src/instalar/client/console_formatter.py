@@ -1,50 +1,64 @@
 from rich.text import Text
 from rich.markdown import Markdown
 
+# Sections rendered by format_response_text, in display order
+_ORDER = ('title', 'description', 'execution', 'expected', 'verification', 'conclusion')
+
 class ConsoleFormatter:
     """Handles formatting of text and commands for display"""
     
-    @staticmethod
-    def format_command_block(cmd: str, block_type: str) -> Text:
+    # Separator line drawn around command blocks, built once
+    _sep_line = Text('─' * 80 + '\n', style="dim")
+    
+    # Command block parts before and after the command, copied for each block
+    _EXEC_TEMPLATE = Text.assemble('\n', _sep_line, ('Execute Command:', "bold cyan"), '\n\n')
+    _VERIFY_TEMPLATE = Text.assemble('\n', _sep_line, ('Verify Command:', "bold cyan"), '\n\n')
+    _BLOCK_TAIL = Text.assemble('\n', _sep_line)
+    
+    # Last rendered sections and their formatted text
+    _last_key = None
+    _last_text = None
+    
+    @classmethod
+    def format_command_block(cls, cmd: str, block_type: str) -> Text:
         """Format a command block with proper styling
         block_type should be either 'exec' or 'verify'"""
-        result = Text()
-        result.append('\n')
-        # Add a separator line before command
-        result.append('─' * 80 + '\n', style="dim")
-        # Add command section header
-        header = 'Execute Command:' if block_type == 'exec' else 'Verify Command:'
-        result.append(header, style="bold cyan")
-        result.append('\n\n')
-        # Add command with syntax highlighting
+        result = (cls._EXEC_TEMPLATE if block_type == 'exec' else cls._VERIFY_TEMPLATE).copy()
         result.append(cmd, style="bold white on black")
-        result.append('\n')
-        # Add a separator line after command
-        result.append('─' * 80 + '\n', style="dim")
+        result.append_text(cls._BLOCK_TAIL)
         return result
 
-    @staticmethod
-    def format_response_text(sections: dict) -> Text:
+    @classmethod
+    def format_response_text(cls, sections: dict) -> Text:
         """Format the response sections into displayable text"""
-        formatted_text = Text()
+        # Streaming re-renders the same sections often; reuse the last result
+        key = tuple(sections[k] for k in _ORDER)
+        if key == cls._last_key:
+            return cls._last_text
+        
+        # Collect (text, style) spans and build the Text once
+        spans = []
         
         if sections['title']:
-            formatted_text.append(f"\n## {sections['title']}\n\n", style="bold cyan")
+            spans.append((f"\n## {sections['title']}\n\n", "bold cyan"))
         
         if sections['description']:
-            formatted_text.append(f"{sections['description']}\n\n")
+            spans.append(f"{sections['description']}\n\n")
             
         if sections['execution']:
-            formatted_text.append(ConsoleFormatter.format_command_block(sections['execution'], 'exec'))
+            spans.append(cls.format_command_block(sections['execution'], 'exec'))
             
         if sections['expected']:
-            formatted_text.append("\nExpected Outcome:\n", style="bold yellow")
-            formatted_text.append(f"{sections['expected']}\n")
+            spans.append(("\nExpected Outcome:\n", "bold yellow"))
+            spans.append(f"{sections['expected']}\n")
             
         if sections['verification']:
-            formatted_text.append(ConsoleFormatter.format_command_block(sections['verification'], 'verify'))
+            spans.append(cls.format_command_block(sections['verification'], 'verify'))
             
         if sections['conclusion']:
-            formatted_text.append(f"\n{sections['conclusion']}\n", style="italic")
-            
+            spans.append((f"\n{sections['conclusion']}\n", "italic"))
+        
+        formatted_text = Text.assemble(*spans)
+        cls._last_key = key
+        cls._last_text = formatted_text
         return formatted_text
@@ -1,12 +1,31 @@
 import json
+import textwrap
 from typing import Optional, Tuple
 from rich.markdown import Markdown
 
+# Markdown is parsed once here rather than every time it is shown
+_HELP_MD = Markdown(textwrap.dedent("""
+    # Available Commands
+    - `help`: Show this help
+    - `exit`: Exit/close/end the program
+    - `close`: Exit/close/end the program
+    - `end`: Exit/close/end the program
+    - `clear`: Clear the screen
+    - `system`: Show detected system information
+    - `menu`: Return to main menu
+    - `main`: Return to main menu
+    - `home`: Return to main menu
+    """))
+_SYSTEM_INFO_MD = Markdown("# System Information")
+
 class CommandProcessor:
     """Processes user commands and handles command loop logic"""
     
     def __init__(self, terminal):
         self.terminal = terminal
+        # JSON dump of system_info and the system_info version it was made from
+        self._sys_info_json = None
+        self._sys_info_json_ver = -1
     
     def handle_vendor_selection(self, selection: str) -> Tuple[str, Optional[str]]:
         """Handle vendor selection and operations menu"""
@@ -27,6 +46,7 @@ class CommandProcessor:
         self.terminal.system_info['user_select_info']['mode_type'] = mode_type
         self.terminal.system_info['user_select_info']['selected_vendor'] = selection
         self.terminal.system_info['user_select_info']['selected_operation'] = obs_operation
+        self.terminal.system_info_version += 1
         
         # Construct a meaningful message based on selections
         try:
@@ -60,31 +80,28 @@ class CommandProcessor:
                 elif cmd in ('home', 'main', 'menu'):
                     return True  # Return to main menu
                 elif cmd == 'help':
-                    self.terminal.show_markdown("""
-                    # Available Commands
-                    - `help`: Show this help
-                    - `exit`: Exit/close/end the program
-                    - `close`: Exit/close/end the program
-                    - `end`: Exit/close/end the program
-                    - `clear`: Clear the screen
-                    - `system`: Show detected system information
-                    - `menu`: Return to main menu
-                    - `main`: Return to main menu
-                    - `home`: Return to main menu
-                    """)
+                    self.terminal.console.print(_HELP_MD)
                 elif cmd == 'clear':
                     self.terminal.console.clear()
                 elif cmd == 'system':
-                    self.terminal.show_markdown("# System Information")
+                    self.terminal.console.print(_SYSTEM_INFO_MD)
                     # Initialize exec_verify_info if it doesn't exist
                     if 'exec_verify_info' not in self.terminal.system_info:
                         self.terminal.system_info['exec_verify_info'] = {}
+                        self.terminal.system_info_version += 1
+                    exec_verify_info = self.terminal.system_info['exec_verify_info']
                     # Add current commands to system info under exec_verify_info
-                    if self.terminal.last_exec_command:
-                        self.terminal.system_info['exec_verify_info']['last_exec_command'] = self.terminal.last_exec_command
-                    if self.terminal.last_verify_command:
-                        self.terminal.system_info['exec_verify_info']['last_verify_command'] = self.terminal.last_verify_command
-                    self.terminal.console.print(json.dumps(self.terminal.system_info, indent=2))
+                    if self.terminal.last_exec_command and exec_verify_info.get('last_exec_command') != self.terminal.last_exec_command:
+                        exec_verify_info['last_exec_command'] = self.terminal.last_exec_command
+                        self.terminal.system_info_version += 1
+                    if self.terminal.last_verify_command and exec_verify_info.get('last_verify_command') != self.terminal.last_verify_command:
+                        exec_verify_info['last_verify_command'] = self.terminal.last_verify_command
+                        self.terminal.system_info_version += 1
+                    # Only re-serialize system info if it changed since the last dump
+                    if self._sys_info_json_ver != self.terminal.system_info_version:
+                        self._sys_info_json = json.dumps(self.terminal.system_info, indent=2, default=str)
+                        self._sys_info_json_ver = self.terminal.system_info_version
+                    self.terminal.console.print(self._sys_info_json)
                 else:
                     try:
                         self.terminal.message_broker.add_message(cmd)
@@ -132,6 +149,7 @@ class CommandProcessor:
             self.terminal.system_info['exec_verify_info'] = {}
         self.terminal.system_info['exec_verify_info']['last_verification_result'] = result
         self.terminal.system_info['exec_verify_info']['last_verification_status'] = success
+        self.terminal.system_info_version += 1
 
         # Handle the verification status
         try:
@@ -1,5 +1,22 @@
 import re
-from typing import Dict
+from typing import Dict, List
+
+# Patterns are compiled once since they are matched on every streamed chunk
+_CODE_BLOCK_RE = re.compile(r"```(?:xml|bash|shell|\w+)?\n?(.*?)```", re.DOTALL)
+_TERMINATE_RE = re.compile(r"<terminate>.*?</terminate>", re.DOTALL | re.IGNORECASE)
+
+# Sections key and XML tag of each section in a response
+_SECTION_TAGS = (
+    ('title', 'title_section'),
+    ('description', 'description_section'),
+    ('execution', 'execution_section'),
+    ('expected', 'expected_section'),
+    ('verification', 'verification_section'),
+    ('conclusion', 'conclusion_section'),
+)
+
+# Most streamed text StreamingSectionParser holds on to
+_MAX_WINDOW = 64 * 1024
 
 class ResponseHandler:
     """Handles parsing and extraction of LLM responses"""
@@ -9,34 +26,124 @@ class ResponseHandler:
         """Extract content between XML tags, handling both normal and code block formats"""
         # Handle terminate tags case-insensitively
         if tag.lower() == "terminate":
-            pattern = r"<terminate>.*?</terminate>"
-            return "true" if re.search(pattern, text, re.DOTALL | re.IGNORECASE) else ""
+            return "true" if _TERMINATE_RE.search(text) else ""
         
-        # Try standard XML tags first
-        pattern = f"<{tag}>(.*?)</{tag}>"
-        match = re.search(pattern, text, re.DOTALL)
+        # Plain substring search is enough for the flat, non-nested tags used here
+        open_tag = f"<{tag}>"
+        start = text.find(open_tag)
+        if start < 0:
+            return ""
+        start += len(open_tag)
+        end = text.find(f"</{tag}>", start)
+        if end < 0:
+            return ""
+        return ResponseHandler.clean_section_content(text[start:end])
+
+    @staticmethod
+    def clean_section_content(content: str) -> str:
+        """Strip section content, unwrapping it from a backtick code block if present"""
+        content = content.strip()
         
-        if match:
-            content = match.group(1).strip()
-            
-            # If content contains backtick code blocks, extract from them
-            code_pattern = r"```(?:xml|bash|shell|\w+)?\n?(.*?)```"
-            code_match = re.search(code_pattern, content, re.DOTALL)
-            if code_match:
-                return code_match.group(1).strip()
-            
-            return content
-        return ""
+        # If content contains backtick code blocks, extract from them
+        code_match = _CODE_BLOCK_RE.search(content)
+        if code_match:
+            return code_match.group(1).strip()
+        
+        return content
 
     @staticmethod
     def extract_response_sections(text: str) -> Dict[str, str]:
         """Extract all XML sections from the response text"""
+        # Each tag is searched for independently, so a section quoted inside
+        # another one is still found
         return {
-            'think': ResponseHandler.extract_xml_section(text, 'think'),
-            'title': ResponseHandler.extract_xml_section(text, 'title_section'),
-            'description': ResponseHandler.extract_xml_section(text, 'description_section'),
-            'execution': ResponseHandler.extract_xml_section(text, 'execution_section'),
-            'expected': ResponseHandler.extract_xml_section(text, 'expected_section'),
-            'verification': ResponseHandler.extract_xml_section(text, 'verification_section'),
-            'conclusion': ResponseHandler.extract_xml_section(text, 'conclusion_section')
+            key: ResponseHandler.extract_xml_section(text, tag)
+            for key, tag in _SECTION_TAGS
         }
+
+
+class StreamingSectionParser:
+    """Incrementally extracts response sections from a streamed LLM response
+    
+    Gives the same sections as ResponseHandler.extract_response_sections on the
+    text fed so far (independent per-tag search, first occurrence of each
+    section), but each parse() only scans the text fed since the last
+    one, and sections are not scanned again once their closing tag has been
+    seen. Fed chunks are only joined into the text when it is needed, and text
+    that no open section still needs is dropped, so at most _MAX_WINDOW
+    characters are kept (a section longer than that keeps only its end).
+    """
+    
+    # (sections key, opening tag, closing tag)
+    _TAGS = tuple((key, f"<{tag}>", f"</{tag}>") for key, tag in _SECTION_TAGS)
+    
+    def __init__(self):
+        self._text = ""
+        # Chunks fed since the text was last joined
+        self._parts: List[str] = []
+        self.sections: Dict[str, str] = {key: "" for key, _, _ in self._TAGS}
+        # Sections whose closing tag hasn't been seen yet
+        self._pending = list(self._TAGS)
+        # Per section: start of its content once the opening tag is found
+        self._content_start: Dict[str, int] = {}
+        # Per section: offset to resume searching from
+        self._scan_offset: Dict[str, int] = {key: 0 for key, _, _ in self._TAGS}
+
+    @property
+    def text(self) -> str:
+        """Text fed so far that has not yet been dropped by parse()"""
+        if self._parts:
+            self._text += "".join(self._parts)
+            self._parts.clear()
+        return self._text
+
+    def feed(self, chunk: str) -> None:
+        """Add a chunk of streamed text, to be scanned by the next parse()"""
+        self._parts.append(chunk)
+
+    def parse(self) -> Dict[str, str]:
+        """Scan the text fed since the last parse and return the sections found so far"""
+        text = self.text
+        still_pending = []
+        
+        for entry in self._pending:
+            key, open_tag, close_tag = entry
+            start = self._content_start.get(key)
+            if start is None:
+                i = text.find(open_tag, self._scan_offset[key])
+                if i < 0:
+                    # Back off so a tag split across chunks is still found
+                    self._scan_offset[key] = max(0, len(text) - len(open_tag) + 1)
+                    still_pending.append(entry)
+                    continue
+                start = self._content_start[key] = i + len(open_tag)
+                self._scan_offset[key] = start
+            
+            j = text.find(close_tag, self._scan_offset[key])
+            if j < 0:
+                self._scan_offset[key] = max(start, len(text) - len(close_tag) + 1)
+                still_pending.append(entry)
+                continue
+            
+            self.sections[key] = ResponseHandler.clean_section_content(text[start:j])
+        
+        self._pending = still_pending
+        self._discard_parsed(text)
+        return self.sections
+
+    def _discard_parsed(self, text: str) -> None:
+        """Drop the start of the text that no pending section can still need"""
+        keep_from = min(
+            (self._content_start.get(key, self._scan_offset[key]) for key, _, _ in self._pending),
+            default=len(text),
+        )
+        # Cap the window so a section that never closes can't grow it unboundedly
+        keep_from = max(keep_from, len(text) - _MAX_WINDOW)
+        if keep_from <= 0:
+            return
+        
+        self._text = text[keep_from:]
+        for key, _, _ in self._pending:
+            self._scan_offset[key] = max(0, self._scan_offset[key] - keep_from)
+            if key in self._content_start:
+                self._content_start[key] = max(0, self._content_start[key] - keep_from)
@@ -1,6 +1,7 @@
 from typing import Optional
 from rich.console import Console
 from rich.markdown import Markdown
+from rich.text import Text
 
 class MainMenuError(Exception):
     """Base exception for main menu errors"""
@@ -37,6 +38,12 @@ class MainMenu:
                     self.all_options.extend(category_options)
                 if not self.all_options:
                     raise MainMenuError("No menu options available")
+                # Prompt and range error only depend on the option count
+                self._prompt = f"\nEnter number (1-{len(self.all_options)}): "
+                self._range_err = f"Selection must be between 1 and {len(self.all_options)}"
+                # Return values and rendered menu are fixed once options are known
+                self._normalized = [o.lower().replace(" ", "_") for o in self.all_options]
+                self._menu_text = self._build_menu_text()
             except Exception as e:
                 raise MainMenuError(f"Failed to initialize menu options: {str(e)}")
         except MainMenuError as e:
@@ -86,7 +93,7 @@ class MainMenu:
             
             choice_idx = int(choice)
             if not 1 <= choice_idx <= len(self.all_options):
-                raise MainMenuError(f"Selection must be between 1 and {len(self.all_options)}")
+                raise MainMenuError(self._range_err)
             
             return choice_idx
         except ValueError:
@@ -94,15 +101,22 @@ class MainMenu:
         except Exception as e:
             raise MainMenuError(f"Invalid selection: {str(e)}")
 
+    def _build_menu_text(self) -> Text:
+        """Render the menu options into a single Text so it prints in one pass"""
+        lines = []
+        current_index = 1
+        for category, options in self.categories.items():
+            lines.append(Text(""))
+            lines.append(Text(category, style="bold"))
+            for option in options:
+                lines.append(Text(f"{current_index}. {option}"))
+                current_index += 1
+        return Text("\n").join(lines)
+
     def _print_menu(self) -> None:
         """Print the menu options"""
         try:
-            current_index = 1
-            for category, options in self.categories.items():
-                self.console.print(f"\n{category}", style="bold")
-                for option in options:
-                    self.console.print(f"{current_index}. {option}")
-                    current_index += 1
+            self.console.print(self._menu_text)
         except Exception as e:
             raise MainMenuError(f"Error displaying menu: {str(e)}")
 
@@ -112,28 +126,9 @@ class MainMenu:
             self._print_menu()
             
             while True:
+                # Only the input call is guarded for interrupts; validation has its own handling
                 try:
-                    choice = self.console.input(f"\nEnter number (1-{len(self.all_options)}): ")
-                    
-                    try:
-                        choice_idx = self._validate_choice(choice)
-                    except MainMenuError as e:
-                        self.console.print(str(e), style="red")
-                        continue
-                    
-                    selected = self.all_options[choice_idx - 1]
-                    
-                    # Handle special options
-                    if selected == "exit":
-                        return None
-                    elif selected == "help":
-                        self.show_help()
-                        # After showing help, show the menu again
-                        return self.select_option()
-                    
-                    # Return normal selection
-                    return selected.lower().replace(" ", "_")
-                    
+                    choice = self.console.input(self._prompt)
                 except KeyboardInterrupt:
                     self.console.print("\nOperation cancelled by user", style="yellow")
                     return None
@@ -143,6 +138,25 @@ class MainMenu:
                 except Exception as e:
                     self.console.print(f"Error processing selection: {str(e)}", style="red")
                     continue
+                
+                try:
+                    choice_idx = self._validate_choice(choice)
+                except MainMenuError as e:
+                    self.console.print(str(e), style="red")
+                    continue
+                
+                selected = self.all_options[choice_idx - 1]
+                
+                # Handle special options
+                if selected == "exit":
+                    return None
+                elif selected == "help":
+                    self.show_help()
+                    # After showing help, show the menu again
+                    return self.select_option()
+                    
+                # Return normal selection
+                return self._normalized[choice_idx - 1]
                     
         except Exception as e:
             self.console.print(f"Fatal error in menu operation: {str(e)}", style="red")
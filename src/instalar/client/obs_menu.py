@@ -1,6 +1,7 @@
 from typing import Optional
 from rich.console import Console
 from rich.markdown import Markdown
+from rich.text import Text
 
 class ObsMenuError(Exception):
     """Base exception for observability menu errors"""
@@ -38,6 +39,12 @@ class ObsMenu:
                     self.all_options.extend(category_options)
                 if not self.all_options:
                     raise ObsMenuError("No menu options available")
+                # Prompt and range error only depend on the option count
+                self._prompt = f"\nEnter number (1-{len(self.all_options)}): "
+                self._range_err = f"Selection must be between 1 and {len(self.all_options)}"
+                # Return values and rendered menu are fixed once options are known
+                self._normalized = [o.lower() for o in self.all_options]
+                self._menu_text = self._build_menu_text()
             except Exception as e:
                 raise ObsMenuError(f"Failed to initialize menu options: {str(e)}")
         except ObsMenuError as e:
@@ -76,7 +83,7 @@ class ObsMenu:
             
             choice_idx = int(choice)
             if not 1 <= choice_idx <= len(self.all_options):
-                raise ObsMenuError(f"Selection must be between 1 and {len(self.all_options)}")
+                raise ObsMenuError(self._range_err)
             
             return choice_idx
         except ValueError:
@@ -84,17 +91,24 @@ class ObsMenu:
         except Exception as e:
             raise ObsMenuError(f"Invalid selection: {str(e)}")
 
+    def _build_menu_text(self) -> Text:
+        """Render the menu options into a single Text so it prints in one pass"""
+        lines = []
+        lines.append(Text(""))
+        lines.append(Text(f"# {self.vendor.capitalize()} use cases:", style="bold"))
+        current_index = 1
+        for category, options in self.categories.items():
+            lines.append(Text(""))
+            lines.append(Text(category, style="bold"))
+            for option in options:
+                lines.append(Text(f"{current_index}. {option}"))
+                current_index += 1
+        return Text("\n").join(lines)
+
     def _print_menu(self) -> None:
         """Print the menu options"""
         try:
-            self.console.print(f"\n# {self.vendor.capitalize()} use cases:", style="bold")
-            
-            current_index = 1
-            for category, options in self.categories.items():
-                self.console.print(f"\n{category}", style="bold")
-                for option in options:
-                    self.console.print(f"{current_index}. {option}")
-                    current_index += 1
+            self.console.print(self._menu_text)
         except Exception as e:
             raise ObsMenuError(f"Error displaying menu: {str(e)}")
 
@@ -104,26 +118,9 @@ class ObsMenu:
             self._print_menu()
             
             while True:
+                # Only the input call is guarded for interrupts; validation has its own handling
                 try:
-                    choice = self.console.input(f"\nEnter number (1-{len(self.all_options)}): ")
-                    
-                    try:
-                        choice_idx = self._validate_choice(choice)
-                    except ObsMenuError as e:
-                        self.console.print(str(e), style="red")
-                        continue
-                    
-                    selected = self.all_options[choice_idx - 1]
-                    
-                    # Handle special options
-                    if selected == "exit":
-                        return None
-                    elif selected == "menu":
-                        return "menu"  # Special return value to trigger main menu
-                    
-                    # Return normal selection
-                    return selected.lower()
-                    
+                    choice = self.console.input(self._prompt)
                 except KeyboardInterrupt:
                     self.console.print("\nOperation cancelled by user", style="yellow")
                     return None
@@ -133,6 +130,23 @@ class ObsMenu:
                 except Exception as e:
                     self.console.print(f"Error processing selection: {str(e)}", style="red")
                     continue
+                
+                try:
+                    choice_idx = self._validate_choice(choice)
+                except ObsMenuError as e:
+                    self.console.print(str(e), style="red")
+                    continue
+                
+                selected = self.all_options[choice_idx - 1]
+                
+                # Handle special options
+                if selected == "exit":
+                    return None
+                elif selected == "menu":
+                    return "menu"  # Special return value to trigger main menu
+                    
+                # Return normal selection
+                return self._normalized[choice_idx - 1]
                     
         except Exception as e:
             self.console.print(f"Fatal error in menu operation: {str(e)}", style="red")
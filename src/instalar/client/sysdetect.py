@@ -2,20 +2,77 @@
 
 import platform
 import os
+import re
 import subprocess
-import psutil  # For process and service information
-import distro  # For detailed Linux distribution info
+import time
 import logging
-from pathlib import Path
 import json
-from functools import wraps
-import signal
-from concurrent.futures import ThreadPoolExecutor, TimeoutError
-from typing import Dict, List, Optional
-from rich.console import Console
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional, Tuple
 import shutil
 import sys
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Platform details do not change during a run, so resolve them once at import
+_SYSTEM = platform.system()
+_MACHINE = platform.machine()
+_PLATFORM = platform.platform()
+
+# Common log locations per OS
+_LOG_PATHS_BY_SYSTEM = {
+    "Linux": [
+        "/var/log",
+        "/var/log/syslog",
+        "/var/log/messages",
+        "/var/log/apache2",
+        "/var/log/nginx"
+    ],
+    "Darwin": [
+        "/var/log",
+        "/Library/Logs",
+        f"/Users/{os.getenv('USER')}/Library/Logs"
+    ],
+    "Windows": [
+        r"C:\Windows\Logs",
+        r"C:\ProgramData\logs"
+    ],
+}
+
+# Process name fragments of services that can be instrumented with OpenTelemetry
+_INSTRUMENTATION_SERVICE_PATTERNS = frozenset([
+    'java', 'python', 'node', 'nginx', 'apache',
+    'mysql', 'postgres', 'mongo', 'redis',
+    'elasticsearch', 'kafka', 'rabbitmq'
+])
+
+# Single case-insensitive alternation so each process name is scanned once
+# for all patterns, without lowercasing it first
+_SERVICE_RE = re.compile(
+    "|".join(re.escape(p) for p in sorted(_INSTRUMENTATION_SERVICE_PATTERNS)),
+    re.IGNORECASE,
+)
+
+# Filesystem types not worth walking for log files
+_NON_LOCAL_FS_TYPES = frozenset([
+    "tmpfs", "overlay", "proc", "sysfs", "nfs", "nfs4", "cifs", "smb3", "fuse.sshfs"
+])
+
+# Upper bound for kubectl/helm version probes
+_PROBE_TIMEOUT_SECONDS = 2
+
+# Bounds for the log file walk; the prompt does not need an exhaustive listing
+_LOG_SCAN_MAX_DEPTH = 3
+_LOG_SCAN_MAX_FILES = 1000
+
+# How long collect_system_info reuses its last result
+_SYSTEM_INFO_TTL_SECONDS = 60
+
+# Directories under the log roots that hold binary or per-container logs
+_LOG_SCAN_SKIP_DIRS = frozenset(["journal", "lxc", "pods"])
+
 class SystemDetectionError(Exception):
     """Base exception for system detection errors"""
     pass
@@ -24,28 +81,87 @@ class PermissionDeniedError(SystemDetectionError):
     """Raised when permissions are insufficient"""
     pass
 
-class TimeoutError(SystemDetectionError):
+class DetectionTimeoutError(SystemDetectionError):
     """Raised when an operation takes too long"""
     pass
 
-def timeout_handler(signum, frame):
-    raise TimeoutError("Operation timed out")
 
-def with_timeout(seconds):
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # Set the timeout handler
-            signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(seconds)
-            try:
-                result = func(*args, **kwargs)
-            finally:
-                # Disable the alarm
-                signal.alarm(0)
-            return result
-        return wrapper
-    return decorator
+@lru_cache(maxsize=1)
+def _os_release() -> Dict[str, str]:
+    """Parse /etc/os-release into a dict, or return {} if it doesn't exist"""
+    release = {}
+    try:
+        with open("/etc/os-release") as f:
+            for line in f:
+                key, sep, value = line.partition("=")
+                if sep:
+                    release[key.strip()] = value.strip().strip("\"'")
+    except FileNotFoundError:
+        pass
+    return release
+
+@lru_cache(maxsize=1)
+def _distro_info() -> Dict[str, str]:
+    """Return the Linux distribution name, version and codename"""
+    release = _os_release()
+    if release:
+        # One read of os-release covers all three fields
+        return {
+            "distro": release.get("PRETTY_NAME") or release.get("NAME", ""),
+            "version": release.get("VERSION") or release.get("VERSION_ID", ""),
+            "codename": release.get("VERSION_CODENAME", "")
+        }
+    # Older systems without os-release: let distro check the other release files
+    import distro  # Imported here as it's only needed on this fallback path
+    return {
+        "distro": distro.name(True),
+        "version": distro.version(True),
+        "codename": distro.codename()
+    }
+
+@lru_cache(maxsize=4)
+def _log_roots(system: str) -> Tuple[str, ...]:
+    """Return the candidate log paths for an OS, minus any nested in another one
+
+    A nested path's files are already found by the walk of its parent.
+    """
+    roots: List[str] = []
+    for path in sorted(_LOG_PATHS_BY_SYSTEM.get(system, [])):
+        if not any(path.startswith(root + os.sep) for root in roots):
+            roots.append(path)
+    return tuple(roots)
+
+def _read_proc_file(path: str, size: int = 4096) -> bytes:
+    """Read a small /proc file with os.open/os.read, skipping Python's file object layers"""
+    fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        data = os.read(fd, size)
+        if len(data) < size:
+            return data
+        # Rarely needed, e.g. very long command lines
+        parts = [data]
+        while chunk := os.read(fd, size):
+            parts.append(chunk)
+        return b"".join(parts)
+    finally:
+        os.close(fd)
+
+@lru_cache(maxsize=1)
+def _non_local_mounts() -> FrozenSet[str]:
+    """Return mount points of virtual, overlay and network filesystems (Linux only)"""
+    if _SYSTEM != "Linux":
+        return frozenset()
+    mounts = set()
+    try:
+        with open("/proc/mounts") as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) >= 3 and fields[2] in _NON_LOCAL_FS_TYPES:
+                    # /proc/mounts escapes spaces in paths as \040
+                    mounts.add(fields[1].replace("\\040", " "))
+    except OSError:
+        pass
+    return frozenset(mounts)
 
 
 class SystemTelemetryDetection:
@@ -53,6 +169,11 @@ class SystemTelemetryDetection:
         self.system_info = {}
         self.logger = self._setup_logging()
         self.timeout_seconds = 30  # Default timeout for operations
+        # Log files found per path by _get_log_files (None if the path doesn't exist)
+        self._log_files_cache: Dict[str, Optional[List[str]]] = {}
+        # Last successful collect_system_info result and when it was collected
+        self._cache: Optional[dict] = None
+        self._cache_ts = 0.0
 
     def _setup_logging(self) -> logging.Logger:
         logger = logging.getLogger("SystemTelemetryCollector")
@@ -67,24 +188,20 @@ class SystemTelemetryDetection:
         """Collect OS distribution and version information."""
         try:
             os_info = {
-                "system": platform.system(),
-                "machine": platform.machine(),
-                "platform": platform.platform(),
+                "system": _SYSTEM,
+                "machine": _MACHINE,
+                "platform": _PLATFORM,
             }
 
-            if platform.system() == "Linux":
+            if _SYSTEM == "Linux":
                 try:
-                    os_info.update({
-                        "distro": distro.name(True),
-                        "version": distro.version(True),
-                        "codename": distro.codename()
-                    })
+                    os_info.update(_distro_info())
                 except PermissionError as e:
                     self.logger.error(f"Permission denied accessing Linux distribution info: {e}")
                     raise PermissionDeniedError("Cannot access Linux distribution information")
-            elif platform.system() == "Darwin":
+            elif _SYSTEM == "Darwin":
                 os_info["version"] = platform.mac_ver()[0]
-            elif platform.system() == "Windows":
+            elif _SYSTEM == "Windows":
                 os_info["version"] = platform.win32_ver()[0]
 
             return os_info
@@ -101,37 +218,88 @@ class SystemTelemetryDetection:
             "helm_version": None
         }
 
-        try:
-            kubectl_version = subprocess.check_output(["kubectl", "version", "--client", "-o", "json"])
-            k8s_info["kubectl_available"] = True
-            k8s_info["kubectl_version"] = json.loads(kubectl_version)
+        # Launch both probes up front so their process startup overlaps. Helm is
+        # only reported alongside kubectl, so skip it when kubectl isn't installed.
+        kubectl_proc = self._start_probe(["kubectl", "version", "--client=true", "-o", "json"])
+        helm_proc = self._start_probe(["helm", "version", "--short"]) if kubectl_proc else None
 
-            # Check for helm if kubectl is available
-            try:
-                helm_version = subprocess.check_output(["helm", "version", "--short"]).decode().strip()
-                k8s_info["helm_available"] = True
-                k8s_info["helm_version"] = helm_version
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                self.logger.info("Helm not found")
+        # Both probes share one deadline, so the total wait is bounded by a single timeout
+        deadline = time.monotonic() + _PROBE_TIMEOUT_SECONDS
+        kubectl_version = self._finish_probe(kubectl_proc, deadline)
+        helm_version = self._finish_probe(helm_proc, deadline)
 
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        if kubectl_version is None:
             self.logger.info("kubectl not found")
+            return k8s_info
+
+        k8s_info["kubectl_available"] = True
+        k8s_info["kubectl_version"] = json.loads(kubectl_version)
+
+        # Only report helm if kubectl is available
+        if helm_version is None:
+            self.logger.info("Helm not found")
+        else:
+            k8s_info["helm_available"] = True
+            k8s_info["helm_version"] = helm_version.decode().strip()
 
         return k8s_info
 
+    def _start_probe(self, cmd: List[str]) -> Optional[subprocess.Popen]:
+        """Start a version probe subprocess, returning None if the executable is missing."""
+        # Cheap PATH lookup first so a missing tool never costs a fork/exec
+        executable = shutil.which(cmd[0])
+        if executable is None:
+            return None
+        try:
+            return subprocess.Popen([executable, *cmd[1:]], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        except OSError:
+            return None
+
+    def _finish_probe(self, proc: Optional[subprocess.Popen], deadline: float) -> Optional[bytes]:
+        """Wait until deadline for a probe started by _start_probe and return its stdout on success."""
+        if proc is None:
+            return None
+        try:
+            stdout, _ = proc.communicate(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            # e.g. a misconfigured kubeconfig; don't let it hang startup
+            proc.kill()
+            proc.wait()
+            proc.stdout.close()
+            self.logger.warning(f"{proc.args[0]} timed out after {_PROBE_TIMEOUT_SECONDS} seconds")
+            return None
+        if proc.returncode != 0:
+            return None
+        return stdout
+
     def get_running_services(self) -> List[Dict]:
         """Get information about running services that can be instrumented."""
+        if _SYSTEM == "Linux":
+            return self._get_running_services_proc()
+
+        # Only needed off Linux, so not imported at module load
+        import psutil
+
         instrumentation_services = []
+        deadline = time.monotonic() + self.timeout_seconds
 
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+        # Only prefetch the name; cmdline is fetched for matching processes only
+        for proc in psutil.process_iter(['name']):
+            if time.monotonic() > deadline:
+                self.logger.warning("Running services scan stopped at time budget")
+                break
             try:
                 process_info = proc.info
                 # Check for common instrumentation services
                 if self._is_instrumentation_service(process_info):
+                    try:
+                        cmdline = proc.cmdline()
+                    except psutil.AccessDenied:
+                        cmdline = None
                     service_info = {
                         "name": process_info['name'],
-                        "pid": process_info['pid'],
-                        "cmdline": process_info['cmdline']
+                        "pid": proc.pid,
+                        "cmdline": cmdline
                     }
                     instrumentation_services.append(service_info)
             except (psutil.NoSuchProcess, psutil.AccessDenied):
@@ -139,55 +307,108 @@ class SystemTelemetryDetection:
 
         return instrumentation_services
 
-    def _is_instrumentation_service(self, process_info: Dict) -> bool:
-        """Check if a service can be instrumented with OpenTelemetry."""
-        instrumentation_service_patterns = [
-            'java', 'python', 'node', 'nginx', 'apache',
-            'mysql', 'postgresql', 'mongodb', 'redis',
-            'elasticsearch', 'kafka', 'rabbitmq'
+    def _get_running_services_proc(self) -> List[Dict]:
+        """Linux variant of get_running_services reading /proc directly.
+
+        Avoids psutil entirely; cmdline is only read for processes whose name
+        matches. Matches are gathered in parallel lists and turned into dicts
+        at the end.
+        """
+        pids: List[int] = []
+        names: List[str] = []
+        cmdlines: List[Optional[List[str]]] = []
+        deadline = time.monotonic() + self.timeout_seconds
+
+        with os.scandir("/proc") as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                if time.monotonic() > deadline:
+                    self.logger.warning("Running services scan stopped at time budget")
+                    break
+                try:
+                    name = _read_proc_file(f"/proc/{entry.name}/comm").decode(errors="replace").strip()
+                except (FileNotFoundError, ProcessLookupError, PermissionError):
+                    continue
+
+                if not self._is_instrumentation_service({"name": name}):
+                    continue
+
+                try:
+                    raw_cmdline = _read_proc_file(f"/proc/{entry.name}/cmdline")
+                    cmdline = [arg.decode(errors="replace") for arg in raw_cmdline.split(b"\0") if arg]
+                except (FileNotFoundError, ProcessLookupError):
+                    continue
+                except PermissionError:
+                    cmdline = None
+
+                pids.append(int(entry.name))
+                names.append(name)
+                cmdlines.append(cmdline)
+
+        return [
+            {"name": name, "pid": pid, "cmdline": cmdline}
+            for pid, name, cmdline in zip(pids, names, cmdlines)
         ]
 
-        return any(pattern in str(process_info['name']).lower()
-                   for pattern in instrumentation_service_patterns)
+    def _is_instrumentation_service(self, process_info: Dict) -> bool:
+        """Check if a service can be instrumented with OpenTelemetry."""
+        name = process_info['name']
+        # psutil reports None for names it couldn't read
+        return name is not None and _SERVICE_RE.search(name) is not None
 
     def get_log_locations(self) -> Dict[str, str]:
         """Identify common log locations based on OS."""
         log_locations = {}
 
-        if platform.system() == "Linux":
-            common_paths = [
-                "/var/log",
-                "/var/log/syslog",
-                "/var/log/messages",
-                "/var/log/apache2",
-                "/var/log/nginx"
-            ]
-        elif platform.system() == "Darwin":
-            common_paths = [
-                "/var/log",
-                "/Library/Logs",
-                f"/Users/{os.getenv('USER')}/Library/Logs"
-            ]
-        elif platform.system() == "Windows":
-            common_paths = [
-                r"C:\Windows\Logs",
-                r"C:\ProgramData\logs"
-            ]
-
-        for path in common_paths:
-            if os.path.exists(path):
-                log_locations[path] = self._get_log_files(path)
+        for path in _log_roots(_SYSTEM):
+            log_files = self._get_log_files(path)
+            if log_files is not None:
+                log_locations[path] = log_files
 
         return log_locations
 
-    def _get_log_files(self, path: str) -> List[str]:
-        """Get list of log files in a directory."""
+    def _get_log_files(self, path: str) -> Optional[List[str]]:
+        """Get list of log files in a directory, or None if the path doesn't exist.
+
+        Walks at most _LOG_SCAN_MAX_DEPTH levels deep without following
+        symlinks or entering _LOG_SCAN_SKIP_DIRS, and stops after
+        _LOG_SCAN_MAX_FILES matches. Results are cached per path since log
+        directories don't change meaningfully during a run.
+        """
+        if path not in self._log_files_cache:
+            self._log_files_cache[path] = self._scan_log_files(path)
+        return self._log_files_cache[path]
+
+    def _scan_log_files(self, path: str) -> Optional[List[str]]:
+        """Walk path for log files; the first scandir doubles as the existence check"""
         log_files = []
-        try:
-            for entry in Path(path).rglob("*.log"):
-                log_files.append(str(entry))
-        except PermissionError:
-            self.logger.warning(f"Permission denied accessing {path}")
+        skip_mounts = _non_local_mounts()
+        stack = [(path, 0)]
+        while stack:
+            current, depth = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        # Uses the dirent type, so no extra stat per entry
+                        if entry.is_dir(follow_symlinks=False):
+                            # Don't descend into container overlays or network mounts
+                            if (depth < _LOG_SCAN_MAX_DEPTH
+                                    and entry.name not in _LOG_SCAN_SKIP_DIRS
+                                    and entry.path not in skip_mounts):
+                                stack.append((entry.path, depth + 1))
+                        elif entry.name.endswith(".log"):
+                            log_files.append(entry.path)
+                            if len(log_files) >= _LOG_SCAN_MAX_FILES:
+                                return log_files
+            except NotADirectoryError:
+                continue
+            except PermissionError:
+                if depth == 0:
+                    self.logger.warning(f"Permission denied accessing {path}")
+            except FileNotFoundError:
+                if depth == 0:
+                    return None
         return log_files
 
     def get_terminal_info(self) -> Dict[str, Optional[str]]:
@@ -202,9 +423,10 @@ class SystemTelemetryDetection:
             "shell": None
         }
 
+        getenv = os.environ.get
         try:
             # Get terminal type
-            terminal_info["terminal_type"] = os.environ.get("TERM")
+            terminal_info["terminal_type"] = getenv("TERM")
             
             # Get terminal size
             try:
@@ -223,17 +445,17 @@ class SystemTelemetryDetection:
             terminal_info["color_support"] = sys.stdout.isatty()
 
             # Get terminal program
-            terminal_info["terminal_program"] = os.environ.get("TERM_PROGRAM")
+            terminal_info["terminal_program"] = getenv("TERM_PROGRAM")
 
             # Get current shell
-            terminal_info["shell"] = os.environ.get("SHELL")
+            terminal_info["shell"] = getenv("SHELL")
 
             # Additional environment variables that might be useful
-            if os.environ.get("COLORTERM"):
-                terminal_info["color_term"] = os.environ.get("COLORTERM")
+            if color_term := getenv("COLORTERM"):
+                terminal_info["color_term"] = color_term
             
-            if os.environ.get("TERM_PROGRAM_VERSION"):
-                terminal_info["terminal_version"] = os.environ.get("TERM_PROGRAM_VERSION")
+            if terminal_version := getenv("TERM_PROGRAM_VERSION"):
+                terminal_info["terminal_version"] = terminal_version
 
         except Exception as e:
             self.logger.error(f"Error getting terminal information: {e}")
@@ -242,13 +464,23 @@ class SystemTelemetryDetection:
         return terminal_info
 
     def collect_system_info(self, console: Optional['Console'] = None) -> dict:
-        """Collect system information during initialization"""
+        """Collect system information during initialization
+
+        A successful result is reused for _SYSTEM_INFO_TTL_SECONDS; use
+        cache_clear() to force a fresh collection. Each call returns its own
+        shallow copy, since callers add session state to the returned dict.
+        """
+        now = time.monotonic()
+        if self._cache is not None and now - self._cache_ts < _SYSTEM_INFO_TTL_SECONDS:
+            return dict(self._cache)
         try:
             if console:
                 console.print("Collecting system information...", style="yellow")
             system_info = self.collect_all()
             if console:
                 console.print("System information collected successfully.", style="green")
+            self._cache = dict(system_info)
+            self._cache_ts = now
             return system_info
         except SystemDetectionError as e:
             if console:
@@ -259,29 +491,48 @@ class SystemTelemetryDetection:
                 console.print(f"Warning: Could not collect system information: {str(e)}", style="yellow")
             return {}
 
+    def cache_clear(self) -> None:
+        """Drop the result cached by collect_system_info"""
+        self._cache = None
+        self._cache_ts = 0.0
+
     def collect_all(self) -> Dict:
-        """Collect all system information."""
+        """Collect all system information.
+
+        Timeouts are enforced by waiting on the collectors with one shared
+        timeout, plus the subprocess timeouts in check_kubernetes; a worker
+        thread blocked in a syscall can't be interrupted, so on timeout it is
+        abandoned rather than awaited.
+        """
+        executor = ThreadPoolExecutor(max_workers=3)
         try:
-            with ThreadPoolExecutor() as executor:
-                future_os = executor.submit(self.get_os_info)
-                future_terminal = executor.submit(self.get_terminal_info)
-                future_k8s = executor.submit(self.check_kubernetes)
-                future_services = executor.submit(self.get_running_services)
-
-                try:
-                    self.system_info = {
-                        "os_info": future_os.result(timeout=self.timeout_seconds),
-                        "terminal_info": future_terminal.result(timeout=self.timeout_seconds),
-                        "kubernetes_info": future_k8s.result(timeout=self.timeout_seconds),
-                        "running_services_info": future_services.result(timeout=self.timeout_seconds)
-                    }
-                except TimeoutError:
-                    self.logger.error("System information collection timed out")
-                    raise SystemDetectionError("Operation timed out while collecting system information")
+            # Terminal info only reads the environment, so it isn't worth a thread
+            terminal_info = self.get_terminal_info()
+
+            future_os = executor.submit(self.get_os_info)
+            future_k8s = executor.submit(self.check_kubernetes)
+            future_services = executor.submit(self.get_running_services)
+
+            _, not_done = wait((future_os, future_k8s, future_services), timeout=self.timeout_seconds)
+            if not_done:
+                self.logger.error("System information collection timed out")
+                raise DetectionTimeoutError("Operation timed out while collecting system information")
+
+            self.system_info = {
+                "os_info": future_os.result(),
+                "terminal_info": terminal_info,
+                "kubernetes_info": future_k8s.result(),
+                "running_services_info": future_services.result()
+            }
 
+        except SystemDetectionError:
+            raise
         except Exception as e:
             self.logger.error(f"Error collecting system information: {e}")
             raise SystemDetectionError(f"Failed to collect system information: {str(e)}")
+        finally:
+            # Don't wait on a worker that is still stuck after a timeout
+            executor.shutdown(wait=False, cancel_futures=True)
 
         return self.system_info
 
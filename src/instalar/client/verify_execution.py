@@ -1,8 +1,28 @@
 import subprocess
 import shlex
+import shutil
+import threading
+import time
+from collections import deque
 from rich.console import Console
 from rich.markdown import Markdown
-from typing import Optional
+from rich.syntax import Syntax
+from typing import List, Optional
+
+# Lines of stdout/stderr kept for the verification result
+_MAX_CAPTURED_LINES = 1000
+
+# Seconds to wait for the output readers once the command has exited
+_READER_JOIN_TIMEOUT = 1
+
+# Characters that need shell interpretation (pipes, redirects, expansion, etc.)
+_SHELL_CHARS = frozenset("|&;<>()$`*?[]{}~#!\n")
+
+# Builtins that have no executable on PATH and must run through the shell
+_SHELL_BUILTINS = frozenset([
+    "cd", "command", "type", "export", "source", ".", "set", "unset",
+    "alias", "hash", "ulimit", "umask", "eval", "exec", "exit", "read"
+])
 
 class VerificationError(Exception):
     """Base exception for verification errors"""
@@ -45,6 +65,29 @@ class VerificationOutput:
             self.console.print(Markdown(f"\n❌ **Error handling verification status**: {str(e)}"), style="red")
             raise VerificationError(f"Error handling verification status: {str(e)}")
 
+    @staticmethod
+    def _split_command(verify_command: str) -> Optional[List[str]]:
+        """Split a command into argv, or return None if it needs a shell to run"""
+        if any(c in _SHELL_CHARS for c in verify_command):
+            return None
+        try:
+            argv = shlex.split(verify_command)
+        except ValueError:
+            return None
+        if not argv or argv[0] in _SHELL_BUILTINS or "=" in argv[0]:
+            return None
+        return argv
+
+    def _stream_lines(self, stream, captured: deque, lock: threading.Lock, style: Optional[str]) -> None:
+        """Print lines from a subprocess pipe as they arrive and keep them in captured"""
+        try:
+            for line in stream:
+                with lock:
+                    captured.append(line)
+                self.console.out(line, end="", style=style, highlight=False)
+        finally:
+            stream.close()
+
     def run_verification(self, verify_command: Optional[str], timeout: int = 30) -> bool | tuple[bool, str]:
         """Run verification command and display results
         
@@ -65,46 +108,79 @@ class VerificationOutput:
             
         try:
             self.console.print(Markdown("\n## Running verification command:"))
-            self.console.print(Markdown(f"```bash\n{verify_command}\n```"))
+            self.console.print(Syntax(verify_command, "bash", word_wrap=True))
+            
+            # Run directly when possible; only commands needing the shell go through /bin/sh
+            argv = self._split_command(verify_command)
+            if argv is not None and shutil.which(argv[0]) is None:
+                # Not an executable on PATH (e.g. a shell builtin); let the shell decide
+                argv = None
             
             try:
-                # Execute the verification command and capture output
-                result = subprocess.run(
-                    verify_command,
-                    shell=True,
-                    capture_output=True,
+                # Stream output as it arrives instead of buffering until exit
+                proc = subprocess.Popen(
+                    verify_command if argv is None else argv,
+                    shell=argv is None,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
                     text=True,
-                    timeout=timeout
+                    bufsize=1
                 )
-            except subprocess.TimeoutExpired as e:
-                raise CommandTimeoutError(f"Command timed out after {timeout} seconds")
-            except subprocess.SubprocessError as e:
+            except (OSError, subprocess.SubprocessError) as e:
                 if "command not found" in str(e).lower():
                     raise CommandNotFoundError(f"Command not found: {shlex.split(verify_command)[0]}")
                 raise CommandExecutionError(f"Error executing command: {str(e)}")
             
-            # Show the command output
             self.console.print(Markdown("\n## Verification Results:"))
-            if result.stdout:
-                self.console.print(Markdown("### Output:"))
-                self.console.print(Markdown(f"```\n{result.stdout}\n```"))
-            if result.stderr:
-                self.console.print(Markdown("### Errors:"))
-                self.console.print(Markdown(f"```\n{result.stderr}\n```"))
+            
+            # Only the tail of each stream is kept for the result sent back to the LLM
+            stdout_lines = deque(maxlen=_MAX_CAPTURED_LINES)
+            stderr_lines = deque(maxlen=_MAX_CAPTURED_LINES)
+            # Guards the deques, as readers may still be appending when the result is built
+            lines_lock = threading.Lock()
+            readers = [
+                threading.Thread(target=self._stream_lines, args=(proc.stdout, stdout_lines, lines_lock, None), daemon=True),
+                threading.Thread(target=self._stream_lines, args=(proc.stderr, stderr_lines, lines_lock, "red"), daemon=True),
+            ]
+            for reader in readers:
+                reader.start()
+            
+            try:
+                returncode = proc.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                raise CommandTimeoutError(f"Command timed out after {timeout} seconds")
+            finally:
+                # One shared deadline so the readers together wait at most _READER_JOIN_TIMEOUT
+                join_deadline = time.monotonic() + _READER_JOIN_TIMEOUT
+                for reader in readers:
+                    reader.join(timeout=max(0.0, join_deadline - time.monotonic()))
+            
+            # A reader still running means the pipe is held open, e.g. by a
+            # background child, so the captured output may be cut short
+            output_incomplete = any(reader.is_alive() for reader in readers)
             
             # Show the return code
-            status = "✅ Success" if result.returncode == 0 else "❌ Failed"
-            self.console.print(Markdown(f"\n**Status**: {status} (return code: {result.returncode})"))
+            status = "✅ Success" if returncode == 0 else "❌ Failed"
+            self.console.print(Markdown(f"\n**Status**: {status} (return code: {returncode})"))
+            if output_incomplete:
+                self.console.print("Output may be incomplete: the command's output streams are still open", style="yellow")
             
             # Format verification result as string
+            with lines_lock:
+                stdout = "".join(stdout_lines)
+                stderr = "".join(stderr_lines)
             verification_result = ""
-            if result.stdout:
-                verification_result += f"Output:\n{result.stdout}\n"
-            if result.stderr:
-                verification_result += f"Errors:\n{result.stderr}\n"
-            verification_result += f"Status: {'Success' if result.returncode == 0 else 'Failed'} (return code: {result.returncode})"
+            if stdout:
+                verification_result += f"Output:\n{stdout}\n"
+            if stderr:
+                verification_result += f"Errors:\n{stderr}\n"
+            if output_incomplete:
+                verification_result += f"Note: output may be incomplete; the command's output streams were still open {_READER_JOIN_TIMEOUT}s after it exited\n"
+            verification_result += f"Status: {'Success' if returncode == 0 else 'Failed'} (return code: {returncode})"
             
-            return result.returncode == 0, verification_result
+            return returncode == 0, verification_result
             
         except CommandTimeoutError as e:
             self.console.print(Markdown(f"\n❌ **Timeout Error**: {str(e)}"), style="red")
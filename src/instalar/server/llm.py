@@ -1,28 +1,108 @@
+import queue
+import threading
 from typing import Generator, List, Dict
+import httpx
+import litellm
 from litellm import completion
 from litellm.exceptions import BudgetExceededError, InvalidRequestError, APIError, RateLimitError
 
-# Define function that takes a list of message dictionaries and returns a string generator
-def get_llm_response(messages: List[Dict[str, str]]) -> Generator[str, None, None]:
-    """Stream responses from the LLM"""
+_MODEL = "openrouter/google/gemini-2.0-pro-exp-02-05:free"
+
+# Static completion arguments, shared by every call
+_COMPLETION_KWARGS = {"model": _MODEL, "stream": True}
+
+# Shared keep-alive HTTP client so later turns reuse the provider connection
+# instead of doing a fresh TCP+TLS handshake every time
+litellm.client_session = httpx.Client(timeout=60)
+
+# Marks the end of a stream in the chunk queue
+_STREAM_END = object()
+
+# Tokens are batched until this many characters (or a newline) have arrived
+_FLUSH_CHARS = 64
+
+# Error messages shown to the user in place of a response
+_BUDGET_EXCEEDED_MSG = "\nError: API budget limit exceeded. Please try again later."
+_RATE_LIMIT_MSG = "\nError: Rate limit reached. Please wait a moment before trying again."
+_INVALID_REQUEST_MSG = "\nError: Invalid request - "
+_API_ERROR_MSG = "\nError: API error occurred - "
+
+def _close_stream(response) -> None:
+    """Close the HTTP stream behind a litellm streaming response, if it can be closed"""
+    for stream in (response, getattr(response, "completion_stream", None)):
+        close = getattr(stream, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception:
+                pass
+            return
+
+def _produce_chunks(messages: List[Dict[str, str]], chunks: "queue.Queue[object]", stop: threading.Event) -> None:
+    """Read the LLM stream and push its content onto the queue
+    
+    Tokens are pushed in batches of about _FLUSH_CHARS characters, cut early
+    at line ends. Known API errors are turned into user-facing messages;
+    anything else is put on the queue as-is and re-raised by the consumer.
+    Reading stops, and the stream is closed, once stop is set.
+    """
+    buffer: List[str] = []
+    buffered = 0
+    response = None
     try:
-        response = completion(
-            model="openrouter/google/gemini-2.0-pro-exp-02-05:free",
-            messages=messages,
-            stream=True,
-        )
-        
-        for chunk in response:
-            if chunk.choices[0].delta.content is not None:
-                yield chunk.choices[0].delta.content
-                
+        try:
+            response = completion(messages=messages, **_COMPLETION_KWARGS)
+            
+            for chunk in response:
+                # The consumer has gone away; don't pull the rest of the completion
+                if stop.is_set():
+                    return
+                content = chunk.choices[0].delta.content
+                if content is None:
+                    continue
+                buffer.append(content)
+                buffered += len(content)
+                if buffered >= _FLUSH_CHARS or content.endswith("\n"):
+                    chunks.put("".join(buffer))
+                    buffer.clear()
+                    buffered = 0
+        finally:
+            if stop.is_set():
+                if response is not None:
+                    _close_stream(response)
+            # Hand over the remaining text ahead of any error message
+            elif buffer:
+                chunks.put("".join(buffer))
     except BudgetExceededError:
-        yield "\nError: API budget limit exceeded. Please try again later."
+        chunks.put(_BUDGET_EXCEEDED_MSG)
     except RateLimitError:
-        yield "\nError: Rate limit reached. Please wait a moment before trying again."
+        chunks.put(_RATE_LIMIT_MSG)
     except InvalidRequestError as e:
-        yield f"\nError: Invalid request - {str(e)}"
+        chunks.put(_INVALID_REQUEST_MSG + str(e))
     except APIError as e:
-        yield f"\nError: API error occurred - {str(e)}"
+        chunks.put(_API_ERROR_MSG + str(e))
     except Exception as e:
-        yield f"\nUnexpected error occurred: {str(e)}"
+        # Can't propagate across threads directly, so hand it to the consumer
+        chunks.put(e)
+    finally:
+        chunks.put(_STREAM_END)
+
+# Define function that takes a list of message dictionaries and returns a string generator
+def get_llm_response(messages: List[Dict[str, str]]) -> Generator[str, None, None]:
+    """Stream responses from the LLM
+    
+    The stream is read on a background thread, so the next chunk is received
+    while the caller is still rendering the previous one. If the caller stops
+    early (or the generator is closed), the background thread is told to stop.
+    """
+    chunks: "queue.Queue[object]" = queue.Queue()
+    stop = threading.Event()
+    threading.Thread(target=_produce_chunks, args=(messages, chunks, stop), daemon=True).start()
+    
+    try:
+        while (content := chunks.get()) is not _STREAM_END:
+            if isinstance(content, Exception):
+                raise content
+            yield content
+    finally:
+        stop.set()
@@ -1,8 +1,11 @@
-from typing import Generator, List, Dict
+import logging
+from collections import deque
+from typing import Deque, Generator, List, Dict
 
-from instalar.server.llm import get_llm_response
 from instalar.server.obs_prompt_gen import format_prompt
 
+logger = logging.getLogger(__name__)
+
 class MessageBrokerError(Exception):
     """Base exception class for MessageBroker errors"""
     pass
@@ -10,9 +13,14 @@ class MessageBrokerError(Exception):
 # Define MessageBroker class to manage conversation history and LLM interaction
 class MessageBroker:
     def __init__(self, system_info: dict = None, max_history: int = 100):
-        self.message_history: List[Dict[str, str]] = []
+        # Oldest messages are evicted automatically once max_history is reached
+        self.message_history: Deque[Dict[str, str]] = deque(maxlen=max_history)
         self.max_history = max_history
         self.system_info = system_info
+        # Bumped on every history change so formatted prompts can be reused on retries
+        self._history_version = 0
+        self._cached_version = -1
+        self._cached_formatted: List[Dict[str, str]] = []
     
     def add_message(self, content: str, role: str = "user") -> None:
         """Add a message to the conversation history"""
@@ -21,15 +29,12 @@ class MessageBroker:
         if role not in ["user", "assistant", "system"]:
             raise MessageBrokerError("Invalid role. Must be 'user', 'assistant', or 'system'")
             
-        if len(self.message_history) >= self.max_history:
-            self.message_history.pop(0)  # Remove oldest message if limit reached
-            
         self.message_history.append({
             "role": role,
             "content": content
         })
-
-        # print("***DEBUG self.message_history.append: ", self.message_history)
+        self._history_version += 1
+        logger.debug("Added %s message, history len=%d", role, len(self.message_history))
 
     def get_response(self) -> Generator[str, None, None]:
         """Get streaming response from LLM"""
@@ -37,6 +42,14 @@ class MessageBroker:
             raise MessageBrokerError("No messages in history to generate response from")
         
         # Format messages with prompt template before sending to LLM
-        formatted_messages = format_prompt(self.message_history, self.system_info)
-        # print("***DEBUG get_llm_response: ", formatted_messages)
+        # Reuse the last formatted prompt if history has not changed since (e.g. a retry)
+        if self._cached_version == self._history_version:
+            formatted_messages = self._cached_formatted
+        else:
+            formatted_messages = format_prompt(list(self.message_history), self.system_info)
+            self._cached_formatted = formatted_messages
+            self._cached_version = self._history_version
+        logger.debug("Sending %d formatted messages to LLM", len(formatted_messages))
+        # Imported lazily so litellm is only loaded on the first LLM call, not at startup
+        from instalar.server.llm import get_llm_response
         return get_llm_response(formatted_messages)
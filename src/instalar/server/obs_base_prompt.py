@@ -1,23 +1,14 @@
 """Base prompt template for observability operations"""
 
-def get_base_prompt(vendor: str, operation: str, system_context: str) -> dict:
-    """Return the base prompt template with variables substituted
-    
-    Args:
-        vendor: The selected vendor name
-        operation: The selected operation
-        system_context: Formatted system information
-        
-    Returns:
-        dict: The formatted base prompt with role and content
-    """
-    return {
-        "role": "system",
-        "content": f"""You are a DevOps Engineer specialized in observability and monitoring.
-Your current task is to help with {operation} of {vendor}.
+from functools import lru_cache
+
+# Built once at import; placeholders are, in order: operation, vendor,
+# system_context, vendor, operation
+_BASE_TEMPLATE = """You are a DevOps Engineer specialized in observability and monitoring.
+Your current task is to help with %s of %s.
 
 System Environment:
-{system_context}
+%s
 
 IMPORTANT RESPONSE FORMAT IN XML TAGS (however, if there are no more steps return only <TERMINATE></TERMINATE> tags):
 <response_format>
@@ -57,7 +48,7 @@ Expected outcome:
 </conclusion_section>
 </response_format>"
 
-Follow these guidelines for {vendor} {operation}:
+Follow these guidelines for %s %s:
 - Think step by step before you answer
 - Only answer with certainty.
 - Consider the detected system environment
@@ -79,4 +70,23 @@ Based on the system information:
 - Consider any detected Kubernetes/Helm setup if relevant
 - Account for any detected services that need instrumentation
 - Provide appropriate configuration for the environment"""
+
+@lru_cache(maxsize=128)
+def get_base_prompt(vendor: str, operation: str, system_context: str) -> dict:
+    """Return the base prompt template with variables substituted
+    
+    Results are cached, so the returned dict is shared between callers and
+    must not be mutated.
+    
+    Args:
+        vendor: The selected vendor name
+        operation: The selected operation
+        system_context: Formatted system information
+        
+    Returns:
+        dict: The formatted base prompt with role and content
+    """
+    return {
+        "role": "system",
+        "content": _BASE_TEMPLATE % (operation, vendor, system_context, vendor, operation)
     }
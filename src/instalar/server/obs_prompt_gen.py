@@ -17,144 +17,189 @@ class VendorOperationError(PromptGenerationError):
     """Raised when vendor or operation information is invalid"""
     pass
 
-def _validate_system_info(system_info: Optional[Dict]) -> None:
-    """Validate system information structure"""
+_ALLOWED_ROLES = frozenset({'system', 'user', 'assistant'})
+
+# Roles forwarded to the LLM after the base prompt
+_CHAT_ROLES = frozenset({'user', 'assistant'})
+
+def _is_chat_message(msg: Dict[str, str]) -> bool:
+    """Return True for user/assistant messages"""
+    return msg['role'] in _CHAT_ROLES
+
+# Context and base prompt used when no system information is available
+_EMPTY_XML = "<system_info>No system information available</system_info>"
+_EMPTY_BASE_PROMPT = get_base_prompt("Unknown", "Unknown", _EMPTY_XML)
+
+# Escapes XML-special characters in a single C-level pass
+_XML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+def _xml(value) -> str:
+    """Escape a system info value for embedding in the XML system context"""
+    return str(value).translate(_XML_ESCAPE)
+
+def _status(value) -> str:
+    """Render an availability flag"""
+    return 'Available' if value else 'Not Available'
+
+def _distribution(distro) -> str:
+    """Render the optional distribution element, omitted when unknown"""
+    return f'<distribution>{_xml(distro)}</distribution>' if distro != 'Unknown' else ''
+
+# (system_info key, template, ((field, default, renderer), ...)) for each fixed-shape section
+_SECTIONS = (
+    ('os_info',
+     '<os_info><system>{system}</system><version>{version}</version>{distro}</os_info>',
+     (('system', 'Unknown', _xml), ('version', 'Unknown', _xml), ('distro', 'Unknown', _distribution))),
+    ('terminal_info',
+     '<terminal_info><type>{terminal_type}</type><program>{terminal_program}</program>'
+     '<version>{terminal_version}</version></terminal_info>',
+     (('terminal_type', 'Unknown', _xml), ('terminal_program', 'Unknown', _xml),
+      ('terminal_version', 'Unknown', _xml))),
+    ('kubernetes_info',
+     '<kubernetes_info><kubectl><status>{kubectl_available}</status><version>{kubectl_version}</version></kubectl>'
+     '<helm><status>{helm_available}</status><version>{helm_version}</version></helm></kubernetes_info>',
+     (('kubectl_available', None, _status), ('kubectl_version', 'N/A', _xml),
+      ('helm_available', None, _status), ('helm_version', 'N/A', _xml))),
+)
+
+_SERVICE_FMT = '<service><name>{}</name><pid>{}</pid></service>'.format
+
+def _validate_system_info(system_info: Optional[Dict]) -> Optional[str]:
+    """Validate system information structure, returning an error message or None"""
     if system_info is not None and not isinstance(system_info, dict):
-        raise SystemInfoError("System info must be a dictionary or None")
+        return "System info must be a dictionary or None"
+    return None
 
-def _validate_message_history(message_history: List[Dict[str, str]]) -> None:
-    """Validate message history format"""
+def _validate_message_history(message_history: List[Dict[str, str]]) -> Optional[str]:
+    """Validate message history format, returning an error message or None"""
     if not isinstance(message_history, list):
-        raise MessageFormatError("Message history must be a list")
+        return "Message history must be a list"
     
+    allowed = _ALLOWED_ROLES
     for msg in message_history:
         if not isinstance(msg, dict):
-            raise MessageFormatError("Each message must be a dictionary")
-        if 'role' not in msg or 'content' not in msg:
-            raise MessageFormatError("Messages must contain 'role' and 'content' keys")
-        if msg['role'] not in ['system', 'user', 'assistant']:
-            raise MessageFormatError(f"Invalid message role: {msg['role']}")
-
-def _validate_vendor_operation(system_info: Dict) -> Tuple[str, str]:
-    """Validate and extract vendor and operation information"""
+            return "Each message must be a dictionary"
+        try:
+            role = msg['role']
+            msg['content']
+        except KeyError:
+            return "Messages must contain 'role' and 'content' keys"
+        if role not in allowed:
+            return f"Invalid message role: {role}"
+    return None
+
+# Capitalized vendor/operation names; the set of selections is small
+_CAPITALIZED: Dict[str, str] = {}
+
+def _cap(value: str) -> str:
+    """Return value.capitalize(), reusing the string from earlier calls"""
+    cached = _CAPITALIZED.get(value)
+    return cached if cached is not None else _CAPITALIZED.setdefault(value, value.capitalize())
+
+def _validate_vendor_operation(system_info: Dict) -> Tuple[Optional[str], str, str]:
+    """Validate and extract vendor and operation information
+    
+    Returns (error, vendor, operation); error is None when both are present.
+    """
     user_select = system_info.get('user_select_info', {})
     vendor = user_select.get('selected_vendor', '')
     operation = user_select.get('selected_operation', '')
     
     if not vendor:
-        raise VendorOperationError("No vendor selected")
+        return "No vendor selected", vendor, operation
     if not operation:
-        raise VendorOperationError("No operation selected")
+        return "No operation selected", vendor, operation
     
-    return vendor.capitalize(), operation.capitalize()
+    return None, _cap(vendor), _cap(operation)
 
 def format_system_info_to_xml(system_info: Optional[Dict] = None) -> str:
     """Format system information into XML format"""
+    if error := _validate_system_info(system_info):
+        raise SystemInfoError(error)
+
     try:
-        _validate_system_info(system_info)
-        
         if not system_info:
-            return "<system_info>No system information available</system_info>"
+            return _EMPTY_XML
 
         xml_parts = ['<system_info>']
         
-        # Extract OS info
-        if os_info := system_info.get('os_info', {}):
-            try:
-                xml_parts.append('<os_info>')
-                system = os_info.get('system', 'Unknown')
-                version = os_info.get('version', 'Unknown')
-                distro = os_info.get('distro', 'Unknown')
-                xml_parts.append(f'<system>{system}</system>')
-                xml_parts.append(f'<version>{version}</version>')
-                if distro != 'Unknown':
-                    xml_parts.append(f'<distribution>{distro}</distribution>')
-                xml_parts.append('</os_info>')
-            except Exception as e:
-                raise PromptGenerationError(f"Error formatting OS info: {str(e)}")
-
-        # Extract Terminal info
-        if terminal_info := system_info.get('terminal_info', {}):
-            try:
-                xml_parts.append('<terminal_info>')
-                term_type = terminal_info.get('terminal_type', 'Unknown')
-                term_program = terminal_info.get('terminal_program', 'Unknown')
-                term_version = terminal_info.get('terminal_version', 'Unknown')
-                xml_parts.append(f'<type>{term_type}</type>')
-                xml_parts.append(f'<program>{term_program}</program>')
-                xml_parts.append(f'<version>{term_version}</version>')
-                xml_parts.append('</terminal_info>')
-            except Exception as e:
-                raise PromptGenerationError(f"Error formatting terminal info: {str(e)}")
-
-        # Extract Kubernetes info
-        if k8s_info := system_info.get('kubernetes_info', {}):
-            try:
-                xml_parts.append('<kubernetes_info>')
-                k8s_status = 'Available' if k8s_info.get('kubectl_available') else 'Not Available'
-                k8s_version = k8s_info.get('kubectl_version', 'N/A')
-                helm_status = 'Available' if k8s_info.get('helm_available') else 'Not Available'
-                helm_version = k8s_info.get('helm_version', 'N/A')
-                xml_parts.append(f'<kubectl><status>{k8s_status}</status><version>{k8s_version}</version></kubectl>')
-                xml_parts.append(f'<helm><status>{helm_status}</status><version>{helm_version}</version></helm>')
-                xml_parts.append('</kubernetes_info>')
-            except Exception as e:
-                raise PromptGenerationError(f"Error formatting Kubernetes info: {str(e)}")
+        # OS, terminal and Kubernetes sections are rendered from _SECTIONS
+        for key, template, fields in _SECTIONS:
+            if section := system_info.get(key):
+                xml_parts.append(template.format_map(
+                    {field: render(section.get(field, default)) for field, default, render in fields}
+                ))
 
         # Extract Running Services info
-        if running_services := system_info.get('running_services_info', []):
-            try:
-                if running_services:
-                    xml_parts.append('<running_services>')
-                    for service in running_services:
-                        name = service.get('name', 'Unknown')
-                        pid = service.get('pid', 'N/A')
-                        xml_parts.append(f'<service><name>{name}</name><pid>{pid}</pid></service>')
-                    xml_parts.append('</running_services>')
-            except Exception as e:
-                raise PromptGenerationError(f"Error formatting running services info: {str(e)}")
+        if running_services := system_info.get('running_services_info'):
+            xml_parts.append('<running_services>')
+            xml_parts.extend(
+                _SERVICE_FMT(_xml(service.get('name', 'Unknown')), service.get('pid', 'N/A'))
+                for service in running_services
+            )
+            xml_parts.append('</running_services>')
 
         xml_parts.append('</system_info>')
         return ''.join(xml_parts)
     except Exception as e:
         raise PromptGenerationError(f"Error processing system information: {str(e)}")
 
-def format_prompt(message_history: List[Dict[str, str]], system_info: Optional[Dict] = None) -> List[Dict[str, str]]:
-    """Format the message history with a prompt template"""
-    try:
-        # Validate inputs
-        _validate_message_history(message_history)
-        _validate_system_info(system_info)
+# Only these system_info sections feed the rendered system context
+_SYSTEM_CONTEXT_KEYS = ('os_info', 'terminal_info', 'kubernetes_info', 'running_services_info')
 
-        # Get formatted system information
-        try:
-            system_context = format_system_info_to_xml(system_info)
-        except SystemInfoError as e:
-            raise PromptGenerationError(f"Error formatting system info: {str(e)}")
-        
-        # Get vendor and operation information
-        try:
-            if system_info:
-                vendor, operation = _validate_vendor_operation(system_info)
-            else:
-                vendor, operation = "Unknown", "Unknown"
-        except VendorOperationError as e:
-            raise PromptGenerationError(f"Error with vendor/operation: {str(e)}")
+# Rendered system context per system_info dict: id -> (dict, sections, xml).
+# The dict itself is kept so a recycled id can't return another dict's entry.
+_SYSCTX_CACHE: Dict[int, Tuple[Dict, Tuple, str]] = {}
+_SYSCTX_CACHE_MAX = 64
 
-        # Get the base prompt template
-        base_prompt = get_base_prompt(vendor, operation, system_context)
-
-        try:
-            formatted_messages = [base_prompt] + [
-                msg for msg in message_history 
-                if msg["role"] in ["user", "assistant"]
-            ]
-        except Exception as e:
-            raise PromptGenerationError(f"Error formatting messages: {str(e)}")
+def _get_system_context(system_info: Optional[Dict]) -> str:
+    """Return the XML system context, reusing the rendering for the same system_info dict
+    
+    The cache entry is reused while the dict still holds the same section
+    objects; sections mutated in place are not detected.
+    """
+    if not system_info:
+        return format_system_info_to_xml(system_info)
+    
+    sections = tuple(system_info.get(k) for k in _SYSTEM_CONTEXT_KEYS)
+    cached = _SYSCTX_CACHE.get(id(system_info))
+    if (cached is not None and cached[0] is system_info
+            and all(a is b for a, b in zip(cached[1], sections))):
+        return cached[2]
+    
+    system_context = format_system_info_to_xml(system_info)
+    if len(_SYSCTX_CACHE) >= _SYSCTX_CACHE_MAX:
+        _SYSCTX_CACHE.clear()
+    _SYSCTX_CACHE[id(system_info)] = (system_info, sections, system_context)
+    return system_context
 
-        return formatted_messages
+def format_prompt(message_history: List[Dict[str, str]], system_info: Optional[Dict] = None) -> List[Dict[str, str]]:
+    """Format the message history with a prompt template"""
+    # Validators report problems as messages; they are raised here, once
+    if error := _validate_message_history(message_history):
+        raise MessageFormatError(error)
+    if error := _validate_system_info(system_info):
+        raise SystemInfoError(error)
 
-    except (SystemInfoError, MessageFormatError, VendorOperationError) as e:
-        raise PromptGenerationError(str(e))
+    try:
+        if not system_info:
+            # Without system info the base prompt is always the same
+            base_prompt = _EMPTY_BASE_PROMPT
+        else:
+            # Get formatted system information
+            system_context = _get_system_context(system_info)
+            
+            # Get vendor and operation information
+            error, vendor, operation = _validate_vendor_operation(system_info)
+            if error:
+                raise VendorOperationError(f"Error with vendor/operation: {error}")
+
+            # Get the base prompt template
+            base_prompt = get_base_prompt(vendor, operation, system_context)
+
+        return [base_prompt, *filter(_is_chat_message, message_history)]
+
+    except PromptGenerationError:
+        raise
     except Exception as e:
         raise PromptGenerationError(f"Unexpected error in prompt generation: {str(e)}")